@@ -2,7 +2,8 @@
 Configuration management using Pydantic Settings.
 Reads from environment variables and .env file.
 """
-from pydantic_settings import BaseSettings
+from functools import cached_property
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 class Settings(BaseSettings):
@@ -20,6 +21,9 @@ class Settings(BaseSettings):
     DB_NAME: str
     DB_USER: str
     DB_PASSWORD: str
+    DB_POOL_MIN: int = 10
+    DB_POOL_MAX: int = 100
+    DB_STMT_CACHE: int = 1024
 
     # JWT
     JWT_SECRET: str
@@ -33,6 +37,9 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: Optional[str] = None
+    REDIS_TIMEOUT: float = 0.25  # seconds, connect and per-command
+    REDIS_KEY_PREFIX: str = "notifications:"  # namespace in a shared Redis db
+    UNREAD_COUNT_CACHE_TTL: int = 30  # seconds
 
     # Email API (optional)
     EMAIL_API_URL: Optional[str] = None
@@ -48,12 +55,11 @@ class Settings(BaseSettings):
     ENABLE_DOCS: bool = True
     API_VERSION: str = "1.0.0"
 
-    @property
+    # Settings are read once at import and never mutated afterwards
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
+
+    @cached_property
     def database_url(self) -> str:
         return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
-
 settings = Settings()
@@ -0,0 +1,106 @@
+"""
+Short-window request coalescing for stored procedure calls.
+Concurrent callers submit arguments; a background worker collects them for
+up to max_wait_ms (or max_batch items) and resolves them with one handler call.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+import logging
+import structlog
+
+from app.core.logging_config import level_enabled
+
+logger = structlog.get_logger()
+_debug_enabled = level_enabled(__name__, logging.DEBUG)
+
+# Receives the queued argument tuples, returns one result per tuple in order
+BatchHandler = Callable[[List[Tuple]], Awaitable[List[Any]]]
+
+def _cancel_all(batch: List[Tuple[Tuple, asyncio.Future]]):
+    for _, future in batch:
+        if not future.done():
+            future.cancel()
+
+class Batcher:
+    def __init__(self, name: str, handler: BatchHandler, max_batch: int = 64, max_wait_ms: float = 2):
+        self.name = name
+        self._handler = handler
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def submit(self, *args) -> Any:
+        """Queue one call and wait for its result (or exception)"""
+        if self._worker is None:
+            # Started lazily so the batcher binds to the running event loop
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((args, future))
+        return await future
+
+    async def close(self):
+        """Stop the worker; in-flight batches finish, queued and collecting callers are cancelled"""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+        self._worker = None
+        self._queue = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_wait
+
+            try:
+                while len(batch) < self._max_batch:
+                    if not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Already off the queue, so close() cannot reach these callers
+                _cancel_all(batch)
+                raise
+
+            # Dispatch without blocking collection of the next batch
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Tuple, asyncio.Future]]):
+        if _debug_enabled():
+            logger.debug("batch_dispatch", batcher=self.name, size=len(batch))
+        try:
+            results = await self._handler([args for args, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            _cancel_all(batch)
+            raise
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,76 @@
+"""
+Redis cache client.
+Uses redis.asyncio; every operation fails open (logs and behaves like a miss)
+so a Redis outage never fails a request that the database can still serve.
+Short socket timeouts turn an unreachable or stalled Redis into a fast
+RedisError instead of blocking until the OS gives up on the connection.
+All keys are namespaced with key_prefix, since the Redis db may be shared
+with other services.
+"""
+from redis import asyncio as redis
+from redis.exceptions import RedisError
+from typing import Optional
+import structlog
+
+logger = structlog.get_logger()
+
+class Cache:
+    def __init__(self):
+        self.client: Optional[redis.Redis] = None
+        self.key_prefix = ""
+
+    async def connect(
+        self,
+        host: str,
+        port: int,
+        db: int,
+        password: Optional[str] = None,
+        timeout: float = 0.25,
+        key_prefix: str = "notifications:"
+    ):
+        """Create Redis client (connections are opened lazily by the pool)"""
+        self.client = redis.Redis(
+            host=host,
+            port=port,
+            db=db,
+            password=password or None,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout
+        )
+        self.key_prefix = key_prefix
+        logger.info("cache_connected", host=host, port=port, db=db, key_prefix=key_prefix)
+
+    async def disconnect(self):
+        """Close Redis client"""
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+            logger.info("cache_disconnected")
+
+    async def get(self, key: str) -> Optional[bytes]:
+        if not self.client:
+            return None
+        try:
+            return await self.client.get(self.key_prefix + key)
+        except RedisError as e:
+            logger.warning("cache_get_failed", key=key, error=str(e))
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: int):
+        if not self.client:
+            return
+        try:
+            await self.client.set(self.key_prefix + key, value, ex=ttl)
+        except RedisError as e:
+            logger.warning("cache_set_failed", key=key, error=str(e))
+
+    async def delete(self, *keys: str):
+        if not self.client or not keys:
+            return
+        try:
+            await self.client.delete(*(self.key_prefix + key for key in keys))
+        except RedisError as e:
+            logger.warning("cache_delete_failed", keys=keys, error=str(e))
+
+# Global cache instance
+cache = Cache()
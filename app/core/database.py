@@ -3,29 +3,88 @@ PostgreSQL connection pool management.
 Uses asyncpg for async database operations.
 """
 import asyncpg
-from typing import Optional
+import logging
+import orjson
+from typing import Dict, Optional, Tuple
 import structlog
 
+from app.core.logging_config import level_enabled
+
 logger = structlog.get_logger()
+_debug_enabled = level_enabled(__name__, logging.DEBUG)
+
+# jsonb binary format: 1-byte version (currently 1) + JSON text
+_JSONB_VERSION = b"\x01"
+
+def _encode_jsonb(value) -> bytes:
+    return _JSONB_VERSION + orjson.dumps(value)
+
+def _decode_jsonb(data: bytes):
+    return orjson.loads(data[1:])
 
 class Database:
     def __init__(self):
         self.pool: Optional[asyncpg.Pool] = None
+        # (procedure_name, param_count) -> "SELECT * FROM proc($1, ...)"
+        self._query_cache: Dict[Tuple[str, int], str] = {}
 
-    async def connect(self, database_url: str):
-        """Create database connection pool"""
+    async def connect(
+        self,
+        database_url: str,
+        min_size: int = 10,
+        max_size: int = 100,
+        statement_cache_size: int = 1024
+    ):
+        """
+        Create database connection pool.
+
+        asyncpg opens min_size connections before create_pool returns, so
+        the connection handshake cost is paid at startup, not on first traffic.
+        """
         try:
             self.pool = await asyncpg.create_pool(
                 database_url,
-                min_size=10,
-                max_size=100,
-                command_timeout=60
+                min_size=min_size,
+                max_size=max_size,
+                command_timeout=60,
+                statement_cache_size=statement_cache_size,
+                max_cached_statement_lifetime=0,
+                max_inactive_connection_lifetime=300,
+                init=self._init_connection
             )
-            logger.info("database_connected", pool_size=10)
+            logger.info("database_connected", pool_min=min_size, pool_max=max_size)
         except Exception as e:
             logger.error("database_connection_failed", error=str(e))
             raise
 
+    @staticmethod
+    async def _init_connection(conn: asyncpg.Connection):
+        """
+        Per-connection setup: decode/encode jsonb with orjson instead of stdlib json.
+
+        Uses the binary wire format (a version byte followed by the JSON text),
+        so orjson works on the raw bytes with no intermediate str.
+        uuid columns need no codec: asyncpg already returns uuid.UUID.
+        """
+        await conn.set_type_codec(
+            "jsonb",
+            encoder=_encode_jsonb,
+            decoder=_decode_jsonb,
+            schema="pg_catalog",
+            format="binary"
+        )
+
+    def get_pool_stats(self) -> Dict[str, int]:
+        """Current pool sizing, for health checks and monitoring"""
+        if not self.pool:
+            return {}
+        return {
+            "size": self.pool.get_size(),
+            "idle": self.pool.get_idle_size(),
+            "min_size": self.pool.get_min_size(),
+            "max_size": self.pool.get_max_size()
+        }
+
     async def disconnect(self):
         """Close database connection pool"""
         if self.pool:
@@ -43,16 +102,22 @@ class Database:
         Returns:
             List of Record objects from database
         """
-        async with self.pool.acquire() as conn:
-            # Build parameter placeholders: $1, $2, $3, etc.
+        # Reuse the query text per (procedure, arity); identical text also lets
+        # asyncpg's per-connection statement cache reuse the prepared plan
+        key = (procedure_name, len(args))
+        query = self._query_cache.get(key)
+        if query is None:
             placeholders = ", ".join([f"${i+1}" for i in range(len(args))])
             query = f"SELECT * FROM {procedure_name}({placeholders})"
+            self._query_cache[key] = query
 
-            logger.debug(
-                "executing_stored_procedure",
-                procedure=procedure_name,
-                param_count=len(args)
-            )
+        async with self.pool.acquire() as conn:
+            if _debug_enabled():
+                logger.debug(
+                    "executing_stored_procedure",
+                    procedure=procedure_name,
+                    param_count=len(args)
+                )
 
             result = await conn.fetch(query, *args)
             return result
@@ -3,18 +3,27 @@ Custom exception classes and database error mapping.
 Maps PostgreSQL exceptions to HTTP status codes.
 """
 from fastapi import HTTPException
+from types import MappingProxyType
+import re
 import structlog
 
 logger = structlog.get_logger()
 
 # Exception name -> HTTP status code mapping
-EXCEPTION_MAPPING = {
+# Read-only: _EXCEPTION_PATTERN is compiled from these keys at import time
+EXCEPTION_MAPPING = MappingProxyType({
     "NOTIFICATION_NOT_FOUND": 404,
     "USER_NOT_FOUND": 404,
     "USER_NOT_FOUND_OR_INACTIVE": 404,
     "UNAUTHORIZED_ACCESS": 403,
     "PREMIUM_FEATURE_REQUIRED": 403,
-}
+})
+
+# Single-pass matcher over all exception names. Longer names come first so
+# USER_NOT_FOUND_OR_INACTIVE wins over its USER_NOT_FOUND prefix.
+_EXCEPTION_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(EXCEPTION_MAPPING, key=len, reverse=True)))
+)
 
 def handle_db_exception(e: Exception) -> HTTPException:
     """
@@ -29,16 +38,19 @@ def handle_db_exception(e: Exception) -> HTTPException:
     error_message = str(e)
 
     # Check if error matches known exception patterns
-    for exception_name, status_code in EXCEPTION_MAPPING.items():
-        if exception_name in error_message:
-            # Clean error message
-            clean_message = error_message.split(": ", 1)[-1] if ": " in error_message else error_message
-            logger.warning(
-                "database_exception",
-                exception_type=exception_name,
-                status_code=status_code
-            )
-            return HTTPException(status_code=status_code, detail=clean_message)
+    match = _EXCEPTION_PATTERN.search(error_message)
+    if match:
+        exception_name = match.group(0)
+        status_code = EXCEPTION_MAPPING[exception_name]
+        # Clean error message (strip "PREFIX: " without allocating a split list)
+        idx = error_message.find(": ")
+        clean_message = error_message[idx + 2:] if idx >= 0 else error_message
+        logger.warning(
+            "database_exception",
+            exception_type=exception_name,
+            status_code=status_code
+        )
+        return HTTPException(status_code=status_code, detail=clean_message)
 
     # Unknown error - log and return 500
     logger.error("unexpected_database_error", error=error_message)
@@ -2,8 +2,28 @@
 Structured logging configuration with correlation IDs.
 Uses structlog for JSON logging in production.
 """
+from functools import partial
+from typing import Callable
 import structlog
 import logging
+import orjson
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """JSONRenderer serializer backed by orjson (stdlib logging needs str, not bytes)"""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode()
+
+def level_enabled(name: str, level: int) -> Callable[[], bool]:
+    """
+    Cheap check to run before building a log event's kwargs.
+
+    Bound to the stdlib logger structlog's LoggerFactory writes through for
+    module `name` (it names loggers after the calling module). Works before
+    setup_logging runs, unlike the structlog proxy's isEnabledFor, and
+    honours runtime level changes.
+
+    Usage: _info_enabled = level_enabled(__name__, logging.INFO)
+    """
+    return partial(logging.getLogger(name).isEnabledFor, level)
 
 def setup_logging(environment: str, log_level: str):
     """
@@ -22,7 +42,7 @@ def setup_logging(environment: str, log_level: str):
     ]
 
     if environment == "production":
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
     else:
         processors.append(structlog.dev.ConsoleRenderer())
 
@@ -0,0 +1,17 @@
+"""
+JSON response classes.
+orjson renders UTC datetimes as "+00:00" by default; pydantic (response_model
+routes) renders "Z". OPT_UTC_Z keeps both paths emitting the same format.
+"""
+from typing import Any
+from fastapi.responses import ORJSONResponse
+import orjson
+
+class UTCJSONResponse(ORJSONResponse):
+    """ORJSONResponse that writes UTC datetimes with a "Z" suffix, like pydantic"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+        )
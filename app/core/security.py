@@ -2,20 +2,34 @@
 JWT token validation and user authentication.
 Extracts user_id and subscription_level from JWT tokens.
 """
-from fastapi import HTTPException, Security
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import jwt, JWTError
+from fastapi import Header, HTTPException
+import jwt
+from jwt import InvalidTokenError
+from cachetools import TTLCache
 from typing import Dict, Optional
+from uuid import UUID
+import hashlib
+import hmac
+import threading
+import time
 import structlog
 
 from app.config import settings
 
 logger = structlog.get_logger()
-security = HTTPBearer()
+
+# Decoded token payloads keyed by SHA-256 of the raw token.
+# Entries live at most 30s and never past the token's own `exp`.
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+_token_cache_lock = threading.Lock()
+
+_SERVICE_TOKEN_BYTES = settings.SERVICE_TOKEN.encode()
 
 class TokenData:
     """Parsed JWT token data"""
-    def __init__(self, user_id: str, email: str, subscription_level: str = "free", org_id: Optional[str] = None):
+    __slots__ = ("user_id", "email", "subscription_level", "org_id")
+
+    def __init__(self, user_id: UUID, email: str, subscription_level: str = "free", org_id: Optional[str] = None):
         self.user_id = user_id
         self.email = email
         self.subscription_level = subscription_level
@@ -31,37 +45,69 @@ def verify_jwt_token(token: str) -> Dict:
     Raises:
         HTTPException: If token is invalid or expired
     """
+    key = hashlib.sha256(token.encode()).digest()
+
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached is not None:
+        payload, exp = cached
+        if exp is None or exp > time.time():
+            return payload
+        # Token expired since it was cached - fall through so decode rejects it
+        with _token_cache_lock:
+            _token_cache.pop(key, None)
+
     try:
         payload = jwt.decode(
             token,
             settings.JWT_SECRET,
             algorithms=[settings.JWT_ALGORITHM]
         )
-        return payload
-    except JWTError as e:
+    except InvalidTokenError as e:
         logger.warning("invalid_jwt_token", error=str(e))
         raise HTTPException(
             status_code=401,
             detail="Invalid authentication credentials"
         )
 
+    # Only successfully validated tokens are cached
+    exp = payload.get("exp")
+    with _token_cache_lock:
+        _token_cache[key] = (payload, exp)
+
+    return payload
+
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Security(security)
+    authorization: Optional[str] = Header(None)
 ) -> TokenData:
     """
     FastAPI dependency to extract and validate user from JWT token.
 
+    Reads the Authorization header directly instead of going through
+    HTTPBearer, which builds a credentials model on every request.
+
     Usage in routes:
         async def endpoint(current_user: TokenData = Depends(get_current_user)):
             user_id = current_user.user_id
     """
-    token = credentials.credentials
+    if not authorization or authorization[:7].lower() != "bearer ":
+        raise HTTPException(status_code=401, detail="Missing bearer token")
+
+    token = authorization[7:].strip()
+    if not token:
+        raise HTTPException(status_code=401, detail="Missing bearer token")
     payload = verify_jwt_token(token)
 
     # Extract required fields
-    user_id = payload.get("sub")
+    sub = payload.get("sub")
+
+    if not sub:
+        raise HTTPException(status_code=401, detail="Invalid token payload")
 
-    if not user_id:
+    # Parse once here so routes receive a ready-to-use UUID
+    try:
+        user_id = UUID(sub)
+    except (ValueError, TypeError, AttributeError):
         raise HTTPException(status_code=401, detail="Invalid token payload")
 
     # Extract optional fields (email not required in minimal JWT from auth-api)
@@ -80,5 +126,7 @@ def verify_service_token(token: str) -> bool:
     """
     Verify internal service-to-service token.
     Used for POST /notifications endpoint.
+
+    Compared in constant time to avoid leaking the token via timing.
     """
-    return token == settings.SERVICE_TOKEN
+    return hmac.compare_digest(token.encode(), _SERVICE_TOKEN_BYTES)
@@ -2,20 +2,61 @@
 FastAPI application initialization.
 Sets up middleware, routes, and lifecycle events.
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import structlog
 
 from app.config import settings
 from app.core.logging_config import setup_logging
+from app.core.cache import cache
 from app.core.database import db
+from app.core.responses import UTCJSONResponse
 from app.middleware.correlation import CorrelationMiddleware
+from app.middleware.cors import WildcardCORSMiddleware
 from app.routes import health, notifications, settings as settings_routes
 
 # Setup logging
 setup_logging(settings.ENVIRONMENT, settings.LOG_LEVEL)
 logger = structlog.get_logger()
 
+SETTINGS_PREFIX = f"{settings.API_V1_PREFIX}/settings"
+NOTIFICATIONS_PREFIX = f"{settings.API_V1_PREFIX}/notifications"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the database pool on startup and close it on shutdown"""
+    logger.info(
+        "api_starting",
+        environment=settings.ENVIRONMENT,
+        project=settings.PROJECT_NAME
+    )
+    await db.connect(
+        settings.database_url,
+        min_size=settings.DB_POOL_MIN,
+        max_size=settings.DB_POOL_MAX,
+        statement_cache_size=settings.DB_STMT_CACHE
+    )
+    await cache.connect(
+        settings.REDIS_HOST,
+        settings.REDIS_PORT,
+        settings.REDIS_DB,
+        settings.REDIS_PASSWORD,
+        timeout=settings.REDIS_TIMEOUT,
+        key_prefix=settings.REDIS_KEY_PREFIX
+    )
+    logger.info("api_started")
+
+    yield
+
+    logger.info("api_shutting_down")
+    await notifications.notification_service.close()
+    await cache.disconnect()
+    await db.disconnect()
+    logger.info("api_shutdown_complete")
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -39,7 +80,9 @@ Features subscription management, notification preferences, and delivery status
     redoc_url="/redoc" if settings.ENABLE_DOCS else None,
     openapi_url="/openapi.json" if settings.ENABLE_DOCS else None,
     contact={"name": "Activity Platform Team", "email": "dev@activityapp.com"},
-    license_info={"name": "Proprietary"}
+    license_info={"name": "Proprietary"},
+    default_response_class=UTCJSONResponse,
+    lifespan=lifespan
 )
 
 
@@ -66,58 +109,41 @@ def custom_openapi():
     return app.openapi_schema
 
 
-app.openapi = custom_openapi
-
-# Add CORS middleware
-cors_origins = ["*"] if settings.CORS_ORIGINS == "*" else [
-    origin.strip() for origin in settings.CORS_ORIGINS.split(",")
-]
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Only build the (process-lifetime) schema when docs are actually served
+if settings.ENABLE_DOCS:
+    app.openapi = custom_openapi
 
 # Add correlation ID middleware
 app.add_middleware(CorrelationMiddleware)
 
+# Add CORS middleware last so it runs outermost and preflights skip correlation work
+# Allow-all origins (the default) uses a minimal middleware with no per-request matching
+if settings.CORS_ORIGINS == "*":
+    app.add_middleware(WildcardCORSMiddleware)
+else:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[origin.strip() for origin in settings.CORS_ORIGINS.split(",")],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
 # Include routers
 app.include_router(health.router, tags=["health"])
 # Settings router - separate path to avoid conflict with /{notification_id}
 app.include_router(
     settings_routes.router,
-    prefix=f"{settings.API_V1_PREFIX}/settings",
+    prefix=SETTINGS_PREFIX,
     tags=["settings"]
 )
 # Notifications router
 app.include_router(
     notifications.router,
-    prefix=f"{settings.API_V1_PREFIX}/notifications",
+    prefix=NOTIFICATIONS_PREFIX,
     tags=["notifications"]
 )
 
-# Startup event
-@app.on_event("startup")
-async def startup():
-    """Initialize database connection on startup"""
-    logger.info(
-        "api_starting",
-        environment=settings.ENVIRONMENT,
-        project=settings.PROJECT_NAME
-    )
-    await db.connect(settings.database_url)
-    logger.info("api_started")
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown():
-    """Close database connection on shutdown"""
-    logger.info("api_shutting_down")
-    await db.disconnect()
-    logger.info("api_shutdown_complete")
-
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -1,27 +1,54 @@
 """
 Correlation ID middleware for request tracing.
 Adds X-Trace-ID header to all requests and responses.
+
+Implemented as a plain ASGI middleware: BaseHTTPMiddleware adds a task
+group and memory streams to every request.
 """
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import random
 import structlog
 import uuid
 
-class CorrelationMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # Get or generate correlation ID
-        correlation_id = request.headers.get("X-Trace-ID") or str(uuid.uuid4())
+TRACE_HEADER = b"x-trace-id"
+
+
+def _new_correlation_id() -> str:
+    """Random UUID4 string; trace IDs need uniqueness, not urandom-grade secrecy"""
+    return str(uuid.UUID(int=random.getrandbits(128), version=4))
 
-        # Bind to structlog context
-        structlog.contextvars.bind_contextvars(correlation_id=correlation_id)
 
-        # Process request
-        response = await call_next(request)
+class CorrelationMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        # Add correlation ID to response headers
-        response.headers["X-Trace-ID"] = correlation_id
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Clear context
-        structlog.contextvars.clear_contextvars()
+        # Get or generate correlation ID
+        correlation_id = None
+        for name, value in scope["headers"]:
+            if name == TRACE_HEADER:
+                correlation_id = value.decode("latin-1")
+                break
+        if not correlation_id:
+            correlation_id = _new_correlation_id()
+
+        async def send_with_trace_id(message: Message):
+            # Add correlation ID to response headers
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Trace-ID"] = correlation_id
+            await send(message)
+
+        # Bind to structlog context
+        tokens = structlog.contextvars.bind_contextvars(correlation_id=correlation_id)
 
-        return response
+        try:
+            # Process request
+            await self.app(scope, receive, send_with_trace_id)
+        finally:
+            # Restore previous binding instead of wiping the whole context
+            structlog.contextvars.reset_contextvars(**tokens)
@@ -0,0 +1,69 @@
+"""
+Minimal CORS middleware for the allow-all-origins case (CORS_ORIGINS="*").
+Starlette's CORSMiddleware does per-request origin/header matching that is
+pointless when every origin, method and header is allowed.
+"""
+from starlette.datastructures import MutableHeaders
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ALLOW_METHODS = "DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+PREFLIGHT_MAX_AGE = "600"
+
+
+class WildcardCORSMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        has_cookie = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value.decode("latin-1")
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value.decode("latin-1")
+            elif name == b"cookie":
+                has_cookie = True
+
+        # Not a cross-origin request
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Preflight: answer directly without touching the app
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = {
+                "Access-Control-Allow-Origin": origin,
+                "Access-Control-Allow-Credentials": "true",
+                "Access-Control-Allow-Methods": ALLOW_METHODS,
+                "Access-Control-Max-Age": PREFLIGHT_MAX_AGE,
+                "Vary": "Origin",
+            }
+            if request_headers:
+                headers["Access-Control-Allow-Headers"] = request_headers
+            response = PlainTextResponse("OK", status_code=200, headers=headers)
+            await response(scope, receive, send)
+            return
+
+        # Credentialed (cookie) requests must get the explicit origin back, not "*"
+        allow_origin = origin if has_cookie else "*"
+
+        async def send_with_cors(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["Access-Control-Allow-Origin"] = allow_origin
+                headers["Access-Control-Allow-Credentials"] = "true"
+                if has_cookie:
+                    headers.add_vary_header("Origin")
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -37,6 +37,7 @@ async def health_check():
         status_code=status_code,
         content={
             "status": "ok" if all_ok else "degraded",
-            "checks": checks
+            "checks": checks,
+            "pool": db.get_pool_stats()
         }
     )
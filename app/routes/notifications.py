@@ -9,6 +9,7 @@ import structlog
 
 from app.core.security import get_current_user, TokenData, verify_service_token
 from app.core.exceptions import ValidationException, UnauthorizedException
+from app.core.responses import UTCJSONResponse
 from app.services.notification_service import NotificationService
 from app.schemas.notifications import (
     NotificationListResponse,
@@ -21,6 +22,7 @@ from app.schemas.notifications import (
     UnreadCountResponse,
     CreateNotificationRequest,
     CreateNotificationResponse,
+    InboxResponse,
     PaginationMeta
 )
 
@@ -36,39 +38,46 @@ async def get_notifications(
     status: Optional[NotificationStatus] = Query(None),
     type: Optional[NotificationType] = Query(None),
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0)
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(False)
 ):
     """
-    Get paginated list of user's notifications.
+    Get paginated list of user's notifications, newest first.
 
     Query params:
         - status: Filter by status (unread, read, archived)
         - type: Filter by notification type
         - limit: Page size (1-100, default 20)
-        - offset: Pagination offset (default 0)
+        - cursor: pagination.next_cursor from the previous page (omit for first page)
+        - include_total: Also return pagination.total (default false)
     """
     # Determine if user is premium
     include_premium = current_user.subscription_level != "free"
 
-    notifications, total_count = await notification_service.get_user_notifications(
-        user_id=UUID(current_user.user_id),
+    notifications, next_cursor, total_count = await notification_service.get_user_notifications(
+        user_id=current_user.user_id,
         status=status,
         notification_type=type,
         limit=limit,
-        offset=offset,
-        include_premium_only=include_premium
+        cursor=cursor,
+        include_premium_only=include_premium,
+        include_total=include_total
     )
 
-    return NotificationListResponse(
+    response = NotificationListResponse.model_construct(
         notifications=notifications,
         pagination=PaginationMeta(
-            total=total_count,
             limit=limit,
-            offset=offset,
-            has_more=(offset + limit) < total_count
+            has_more=next_cursor is not None,
+            next_cursor=next_cursor,
+            total=total_count
         )
     )
 
+    # Returning a Response skips FastAPI's outbound re-validation of trusted SP data;
+    # response_model above still documents the shape
+    return UTCJSONResponse(response.model_dump())
+
 @router.get("/unread/count", response_model=UnreadCountResponse)
 async def get_unread_count(
     current_user: TokenData = Depends(get_current_user)
@@ -79,10 +88,43 @@ async def get_unread_count(
     include_premium = current_user.subscription_level != "free"
 
     return await notification_service.get_unread_count(
-        user_id=UUID(current_user.user_id),
+        user_id=current_user.user_id,
+        include_premium_only=include_premium
+    )
+
+@router.get("/inbox", response_model=InboxResponse)
+async def get_inbox(
+    current_user: TokenData = Depends(get_current_user),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None)
+):
+    """
+    Get latest notifications together with unread counts (notification bell).
+
+    Query params:
+        - limit: Page size (1-100, default 20)
+        - cursor: pagination.next_cursor from the previous page (omit for first page)
+    """
+    include_premium = current_user.subscription_level != "free"
+
+    notifications, next_cursor, unread = await notification_service.get_inbox(
+        user_id=current_user.user_id,
+        limit=limit,
+        cursor=cursor,
         include_premium_only=include_premium
     )
 
+    response = InboxResponse.model_construct(
+        notifications=notifications,
+        pagination=PaginationMeta(
+            limit=limit,
+            has_more=next_cursor is not None,
+            next_cursor=next_cursor
+        ),
+        unread=unread
+    )
+    return UTCJSONResponse(response.model_dump())
+
 @router.get("/{notification_id}", response_model=NotificationResponse)
 async def get_notification(
     notification_id: UUID = Path(...),
@@ -91,10 +133,11 @@ async def get_notification(
     """
     Get single notification by ID.
     """
-    return await notification_service.get_notification_by_id(
-        user_id=UUID(current_user.user_id),
+    notification = await notification_service.get_notification_by_id(
+        user_id=current_user.user_id,
         notification_id=notification_id
     )
+    return UTCJSONResponse(notification.model_dump())
 
 @router.patch("/{notification_id}/read")
 async def mark_notification_read(
@@ -105,7 +148,7 @@ async def mark_notification_read(
     Mark single notification as read.
     """
     return await notification_service.mark_as_read(
-        user_id=UUID(current_user.user_id),
+        user_id=current_user.user_id,
         notification_id=notification_id
     )
 
@@ -127,8 +170,8 @@ async def mark_notifications_read_bulk(
         raise ValidationException("notification_type requires mark_all=true")
 
     return await notification_service.mark_as_read_bulk(
-        user_id=UUID(current_user.user_id),
-        notification_ids=[UUID(str(id)) for id in request.notification_ids] if request.notification_ids else None,
+        user_id=current_user.user_id,
+        notification_ids=request.notification_ids or None,
         notification_type=request.notification_type
     )
 
@@ -145,7 +188,7 @@ async def delete_notification(
         - permanent: If true, hard delete. If false (default), archive.
     """
     return await notification_service.delete_notification(
-        user_id=UUID(current_user.user_id),
+        user_id=current_user.user_id,
         notification_id=notification_id,
         permanent=permanent
     )
@@ -164,7 +207,7 @@ async def create_notification(
     if not x_service_token or not verify_service_token(x_service_token):
         raise UnauthorizedException("Invalid service token")
 
-    result = await notification_service.create_notification(
+    return await notification_service.create_notification(
         user_id=request.user_id,
         actor_user_id=request.actor_user_id,
         notification_type=request.notification_type,
@@ -174,9 +217,3 @@ async def create_notification(
         message=request.message,
         payload=request.payload
     )
-
-    # Return 201 if created, 200 if skipped
-    if result.status == "created":
-        return result
-    else:
-        return result
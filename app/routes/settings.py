@@ -11,7 +11,6 @@ from app.schemas.settings import (
     NotificationSettingsResponse,
     UpdateSettingsRequest
 )
-from uuid import UUID
 
 router = APIRouter()
 logger = structlog.get_logger()
@@ -28,7 +27,7 @@ async def get_settings(
     Returns defaults if settings don't exist yet.
     """
     return await settings_service.get_settings(
-        user_id=UUID(current_user.user_id)
+        user_id=current_user.user_id
     )
 
 @router.patch("", response_model=NotificationSettingsResponse)
@@ -43,7 +42,7 @@ async def update_settings(
     Note: ghost_mode requires Premium subscription.
     """
     return await settings_service.update_settings(
-        user_id=UUID(current_user.user_id),
+        user_id=current_user.user_id,
         email_notifications=request.email_notifications,
         push_notifications=request.push_notifications,
         activity_reminders=request.activity_reminders,
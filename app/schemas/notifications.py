@@ -53,11 +53,11 @@ class NotificationResponse(BaseModel):
     payload: Optional[Dict[str, Any]] = None
 
 class PaginationMeta(BaseModel):
-    """Pagination metadata"""
-    total: int
+    """Keyset pagination metadata"""
     limit: int
-    offset: int
     has_more: bool
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None  # only when requested with include_total=true
 
 class NotificationListResponse(BaseModel):
     """Paginated notification list"""
@@ -70,6 +70,12 @@ class UnreadCountResponse(BaseModel):
     by_type: Dict[str, int]
     note: Optional[str] = None
 
+class InboxResponse(BaseModel):
+    """Notification page plus unread badge counts (notification bell)"""
+    notifications: List[NotificationResponse]
+    pagination: PaginationMeta
+    unread: UnreadCountResponse
+
 class MarkReadBulkRequest(BaseModel):
     """Bulk mark-read request"""
     notification_ids: Optional[List[UUID]] = None
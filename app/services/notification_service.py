@@ -2,12 +2,22 @@
 Notification business logic service.
 Calls stored procedures and formats results.
 """
-from typing import List, Optional
+from cachetools import TTLCache
+from datetime import datetime
+import asyncio
+from typing import List, Optional, Tuple
 from uuid import UUID
+import base64
+import logging
+import orjson
 import structlog
 
+from app.config import settings
+from app.core.batcher import Batcher
+from app.core.cache import cache
 from app.core.database import db
-from app.core.exceptions import handle_db_exception
+from app.core.exceptions import handle_db_exception, ValidationException
+from app.core.logging_config import level_enabled
 from app.schemas.notifications import (
     NotificationResponse,
     ActorInfo,
@@ -21,92 +31,246 @@ from app.schemas.notifications import (
 
 logger = structlog.get_logger()
 
+_info_enabled = level_enabled(__name__, logging.INFO)
+
+SKIPPED_REASON = "User has disabled this notification type"
+
+# Unread-count coalescing window (see app/core/batcher.py)
+UNREAD_COUNT_MAX_BATCH = 64
+UNREAD_COUNT_MAX_WAIT_MS = 2
+
+# Per-process get-by-id cache, keyed by (user_id, notification_id).
+# This process's writes evict; other workers see changes within the TTL.
+NOTIFICATION_CACHE_SIZE = 10000
+NOTIFICATION_CACHE_TTL = 60  # seconds
+
+def _unread_cache_key(user_id: UUID, include_premium_only: bool) -> str:
+    return f"unread:{user_id}:{int(include_premium_only)}"
+
+# Bound once: model_construct skips validation for rows from trusted SPs
+_construct_notification = NotificationResponse.model_construct
+_construct_actor = ActorInfo.model_construct
+
+def _encode_cursor(created_at: datetime, notification_id: UUID) -> str:
+    """Opaque keyset cursor for the row a page ended on"""
+    raw = f"{created_at.isoformat()}|{notification_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Inverse of _encode_cursor; malformed cursors are a client error"""
+    try:
+        created_at, notification_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(notification_id)
+    except ValueError:
+        raise ValidationException("Invalid pagination cursor")
+
+# Column contract shared by sp_get_user_notifications(_keyset) and
+# sp_get_notification_by_id (see migrations/01 and 03). Rows are unpacked by
+# position, so any change to these SPs' RETURNS TABLE order must be mirrored
+# here. Trailing extra columns (e.g. the legacy total_count) are ignored.
+# Id columns must stay declared as UUID (not TEXT): asyncpg then decodes them
+# from binary straight into uuid.UUID and model_construct stores them as-is.
+NOTIFICATION_ROW_COLUMNS = 16
+
+def _row_to_notification(row) -> NotificationResponse:
+    """Map a notification list / get-by-id SP row to a response model"""
+    (
+        notification_id, user_id, actor_user_id, actor_username,
+        actor_first_name, actor_last_name, actor_main_photo_url,
+        notification_type, target_type, target_id, title, message,
+        status, created_at, read_at, payload
+    ) = row[:NOTIFICATION_ROW_COLUMNS]
+
+    # Build actor info only if present (system/reminder rows have none)
+    actor = None
+    if actor_user_id is not None:
+        actor = _construct_actor(
+            user_id=actor_user_id,
+            username=actor_username,
+            first_name=actor_first_name,
+            last_name=actor_last_name,
+            main_photo_url=actor_main_photo_url
+        )
+
+    return _construct_notification(
+        notification_id=notification_id,
+        user_id=user_id,
+        actor=actor,
+        notification_type=NotificationType(notification_type),
+        target_type=target_type,
+        target_id=target_id,
+        title=title,
+        message=message,
+        status=NotificationStatus(status),
+        created_at=created_at,
+        read_at=read_at,
+        payload=payload
+    )
+
 class NotificationService:
     """Service for notification operations"""
 
+    def __init__(self):
+        self._unread_count_batcher = Batcher(
+            "unread_count",
+            self._fetch_unread_counts,
+            max_batch=UNREAD_COUNT_MAX_BATCH,
+            max_wait_ms=UNREAD_COUNT_MAX_WAIT_MS
+        )
+        self._notification_cache: TTLCache = TTLCache(
+            maxsize=NOTIFICATION_CACHE_SIZE,
+            ttl=NOTIFICATION_CACHE_TTL
+        )
+
+    async def close(self):
+        """Stop background batch workers"""
+        await self._unread_count_batcher.close()
+
+    async def _evict_unread(self, user_id: UUID):
+        """Drop both cached unread-count variants for a user after a write"""
+        await cache.delete(
+            _unread_cache_key(user_id, False),
+            _unread_cache_key(user_id, True)
+        )
+
+    def _evict_notifications(self, user_id: UUID, notification_ids):
+        """Drop cached get-by-id entries for notifications that changed"""
+        for notification_id in notification_ids:
+            self._notification_cache.pop((user_id, notification_id), None)
+
+    async def _fetch_unread_counts(self, requests: List[Tuple[UUID, bool]]) -> list:
+        """
+        Batch handler: one unread-count row (or None) per (user_id, include_premium_only).
+
+        A single queued request uses the plain SP; larger batches use one bulk call.
+        """
+        if len(requests) == 1:
+            result = await db.execute_sp("activity.sp_get_unread_count", *requests[0])
+            return [result[0] if result else None]
+
+        result = await db.execute_sp(
+            "activity.sp_get_unread_count_bulk",
+            [user_id for user_id, _ in requests],
+            [include_premium_only for _, include_premium_only in requests]
+        )
+        rows = {(row["user_id"], row["include_premium_only"]): row for row in result}
+        return [rows.get(request) for request in requests]
+
     async def get_user_notifications(
         self,
         user_id: UUID,
         status: Optional[NotificationStatus],
         notification_type: Optional[NotificationType],
         limit: int,
-        offset: int,
-        include_premium_only: bool
-    ) -> tuple[List[NotificationResponse], int]:
+        cursor: Optional[str],
+        include_premium_only: bool,
+        include_total: bool = False
+    ) -> tuple[List[NotificationResponse], Optional[str], Optional[int]]:
         """
-        Get paginated notifications for user.
+        Get a page of notifications for user, newest first (keyset pagination).
 
-        Calls: activity.sp_get_user_notifications
+        The total is only computed when include_total is set; it comes from
+        trigger-maintained counters, not from counting the filtered rows.
+
+        Calls: activity.sp_get_user_notifications_keyset,
+               activity.sp_get_notification_totals (include_total only)
 
         Returns:
-            (notifications_list, total_count)
+            (notifications_list, next_cursor, total_count) - next_cursor is None on
+            the last page, total_count is None unless include_total
         """
+        cursor_created_at, cursor_notification_id = _decode_cursor(cursor) if cursor else (None, None)
+
         try:
             # Convert enums to strings (or None)
             status_str = status.value if status else None
             type_str = notification_type.value if notification_type else None
 
-            result = await db.execute_sp(
-                "activity.sp_get_user_notifications",
+            # Fetch one extra row to learn whether another page exists
+            page_query = db.execute_sp(
+                "activity.sp_get_user_notifications_keyset",
                 user_id,
                 status_str,
                 type_str,
-                limit,
-                offset,
+                limit + 1,
+                cursor_created_at,
+                cursor_notification_id,
                 include_premium_only
             )
 
-            if not result:
-                return [], 0
+            total_count = None
+            if include_total:
+                result, totals = await asyncio.gather(
+                    page_query,
+                    db.execute_sp(
+                        "activity.sp_get_notification_totals",
+                        user_id,
+                        status_str,
+                        type_str,
+                        include_premium_only
+                    )
+                )
+                total_count = totals[0]["total_count"] if totals else 0
+            else:
+                result = await page_query
 
-            # Get total count from first row (window function)
-            total_count = result[0]["total_count"] if result else 0
+            if not result:
+                return [], None, total_count
 
             # Format notifications
-            notifications = []
-            for row in result:
-                # Build actor info if present
-                actor = None
-                if row["actor_user_id"]:
-                    actor = ActorInfo(
-                        user_id=row["actor_user_id"],
-                        username=row["actor_username"],
-                        first_name=row["actor_first_name"],
-                        main_photo_url=row["actor_main_photo_url"]
-                    )
+            notifications = [_row_to_notification(row) for row in result[:limit]]
 
-                # Deserialize payload JSON string to dict
-                import json
-                payload_dict = json.loads(row["payload"]) if row["payload"] else None
+            next_cursor = None
+            if len(result) > limit:
+                last = notifications[-1]
+                next_cursor = _encode_cursor(last.created_at, last.notification_id)
 
-                notification = NotificationResponse(
-                    notification_id=row["notification_id"],
-                    user_id=row["user_id"],
-                    actor=actor,
-                    notification_type=row["notification_type"],
-                    target_type=row["target_type"],
-                    target_id=row["target_id"],
-                    title=row["title"],
-                    message=row["message"],
-                    status=row["status"],
-                    created_at=row["created_at"],
-                    read_at=row["read_at"],
-                    payload=payload_dict
+            if _info_enabled():
+                logger.info(
+                    "notifications_retrieved",
+                    user_id=user_id,
+                    count=len(notifications),
+                    has_more=next_cursor is not None,
+                    total=total_count
                 )
-                notifications.append(notification)
-
-            logger.info(
-                "notifications_retrieved",
-                user_id=str(user_id),
-                count=len(notifications),
-                total=total_count
-            )
 
-            return notifications, total_count
+            return notifications, next_cursor, total_count
 
         except Exception as e:
             raise handle_db_exception(e)
 
+    async def get_inbox(
+        self,
+        user_id: UUID,
+        limit: int,
+        cursor: Optional[str],
+        include_premium_only: bool
+    ) -> tuple[List[NotificationResponse], Optional[str], UnreadCountResponse]:
+        """
+        Get a notification page and the unread counts in one call.
+
+        Both lookups run concurrently on separate pool connections, so latency
+        is the slower of the two rather than their sum.
+
+        Returns:
+            (notifications_list, next_cursor, unread_counts)
+        """
+        (notifications, next_cursor, _), unread = await asyncio.gather(
+            self.get_user_notifications(
+                user_id=user_id,
+                status=None,
+                notification_type=None,
+                limit=limit,
+                cursor=cursor,
+                include_premium_only=include_premium_only
+            ),
+            self.get_unread_count(
+                user_id=user_id,
+                include_premium_only=include_premium_only
+            )
+        )
+        return notifications, next_cursor, unread
+
     async def get_notification_by_id(
         self,
         user_id: UUID,
@@ -115,8 +279,16 @@ class NotificationService:
         """
         Get single notification by ID.
 
+        Served from the in-process cache for NOTIFICATION_CACHE_TTL seconds;
+        mark-read and delete evict the entry.
+
         Calls: activity.sp_get_notification_by_id
         """
+        key = (user_id, notification_id)
+        cached = self._notification_cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
             result = await db.execute_sp(
                 "activity.sp_get_notification_by_id",
@@ -127,37 +299,9 @@ class NotificationService:
             if not result:
                 raise Exception("NOTIFICATION_NOT_FOUND")
 
-            row = result[0]
-
-            # Build actor info if present
-            actor = None
-            if row["actor_user_id"]:
-                actor = ActorInfo(
-                    user_id=row["actor_user_id"],
-                    username=row["actor_username"],
-                    first_name=row["actor_first_name"],
-                    last_name=row["actor_last_name"],
-                    main_photo_url=row["actor_main_photo_url"]
-                )
-
-            # Deserialize payload JSON string to dict
-            import json
-            payload_dict = json.loads(row["payload"]) if row["payload"] else None
-
-            return NotificationResponse(
-                notification_id=row["notification_id"],
-                user_id=row["user_id"],
-                actor=actor,
-                notification_type=row["notification_type"],
-                target_type=row["target_type"],
-                target_id=row["target_id"],
-                title=row["title"],
-                message=row["message"],
-                status=row["status"],
-                created_at=row["created_at"],
-                read_at=row["read_at"],
-                payload=payload_dict
-            )
+            notification = _row_to_notification(result[0])
+            self._notification_cache[key] = notification
+            return notification
 
         except Exception as e:
             raise handle_db_exception(e)
@@ -183,12 +327,15 @@ class NotificationService:
                 raise Exception("NOTIFICATION_NOT_FOUND")
 
             row = result[0]
+            self._evict_notifications(user_id, (notification_id,))
+            await self._evict_unread(user_id)
 
-            logger.info(
-                "notification_marked_read",
-                notification_id=str(notification_id),
-                user_id=str(user_id)
-            )
+            if _info_enabled():
+                logger.info(
+                    "notification_marked_read",
+                    notification_id=notification_id,
+                    user_id=user_id
+                )
 
             return {
                 "notification_id": row["notification_id"],
@@ -208,6 +355,8 @@ class NotificationService:
         """
         Mark multiple notifications as read.
 
+        The SP returns updated_count and updated_ids in one round trip.
+
         Calls: activity.sp_mark_notifications_as_read_bulk
         """
         try:
@@ -223,12 +372,16 @@ class NotificationService:
             )
 
             updated_count = result[0]["updated_count"] if result else 0
+            if updated_count:
+                self._evict_notifications(user_id, result[0]["updated_ids"])
+                await self._evict_unread(user_id)
 
-            logger.info(
-                "notifications_marked_read_bulk",
-                user_id=str(user_id),
-                count=updated_count
-            )
+            if _info_enabled():
+                logger.info(
+                    "notifications_marked_read_bulk",
+                    user_id=user_id,
+                    count=updated_count
+                )
 
             return MarkReadResponse(
                 updated_count=updated_count,
@@ -261,12 +414,15 @@ class NotificationService:
                 raise Exception("NOTIFICATION_NOT_FOUND")
 
             row = result[0]
+            self._evict_notifications(user_id, (notification_id,))
+            await self._evict_unread(user_id)
 
-            logger.info(
-                "notification_deleted",
-                notification_id=str(notification_id),
-                permanent=permanent
-            )
+            if _info_enabled():
+                logger.info(
+                    "notification_deleted",
+                    notification_id=notification_id,
+                    permanent=permanent
+                )
 
             return DeleteResponse(
                 success=row["success"],
@@ -284,20 +440,22 @@ class NotificationService:
         """
         Get unread notification counts by type.
 
-        Calls: activity.sp_get_unread_count
+        Served from Redis for UNREAD_COUNT_CACHE_TTL seconds; writes for the
+        user evict the entry. Misses are coalesced by the unread-count batcher.
+
+        Calls: activity.sp_get_unread_count / activity.sp_get_unread_count_bulk
         """
+        cache_key = _unread_cache_key(user_id, include_premium_only)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return UnreadCountResponse.model_construct(**orjson.loads(cached))
+
         try:
-            result = await db.execute_sp(
-                "activity.sp_get_unread_count",
-                user_id,
-                include_premium_only
-            )
+            row = await self._unread_count_batcher.submit(user_id, include_premium_only)
 
-            if not result:
+            if row is None:
                 return UnreadCountResponse(total_unread=0, by_type={})
 
-            row = result[0]
-
             by_type = {
                 "activity_invite": row["activity_invite_count"],
                 "activity_reminder": row["activity_reminder_count"],
@@ -317,11 +475,17 @@ class NotificationService:
             if not include_premium_only:
                 note = "Premium-exclusive notification types (profile_view, new_favorite) are not included"
 
-            return UnreadCountResponse(
+            response = UnreadCountResponse(
                 total_unread=row["total_unread"],
                 by_type=by_type,
                 note=note
             )
+            await cache.set(
+                cache_key,
+                orjson.dumps(response.model_dump()),
+                settings.UNREAD_COUNT_CACHE_TTL
+            )
+            return response
 
         except Exception as e:
             raise handle_db_exception(e)
@@ -343,10 +507,6 @@ class NotificationService:
         Calls: activity.sp_create_notification
         """
         try:
-            # Convert payload dict to JSON string for stored procedure
-            import json
-            payload_json = json.dumps(payload) if payload else None
-
             result = await db.execute_sp(
                 "activity.sp_create_notification",
                 user_id,
@@ -356,43 +516,40 @@ class NotificationService:
                 target_id,
                 title,
                 message,
-                payload_json
+                payload or None
             )
 
-            if not result:
-                return CreateNotificationResponse(
+            row = result[0] if result else None
+
+            # SP returns no row (or a NULL id) when the user disabled this type
+            if row is None or not row["notification_id"]:
+                if _info_enabled():
+                    logger.info(
+                        "notification_skipped",
+                        user_id=user_id,
+                        type=notification_type.value
+                    )
+                return CreateNotificationResponse.model_construct(
                     notification_id=None,
                     created_at=None,
                     status="skipped",
-                    reason="User has disabled this notification type"
+                    reason=SKIPPED_REASON
                 )
 
-            row = result[0]
-
-            if row["notification_id"]:
+            await self._evict_unread(user_id)
+            if _info_enabled():
                 logger.info(
                     "notification_created",
-                    notification_id=str(row["notification_id"]),
-                    user_id=str(user_id),
-                    type=notification_type.value
-                )
-                return CreateNotificationResponse(
                     notification_id=row["notification_id"],
-                    created_at=row["created_at"],
-                    status="created"
-                )
-            else:
-                logger.info(
-                    "notification_skipped",
-                    user_id=str(user_id),
+                    user_id=user_id,
                     type=notification_type.value
                 )
-                return CreateNotificationResponse(
-                    notification_id=None,
-                    created_at=None,
-                    status="skipped",
-                    reason="User has disabled this notification type"
-                )
+            return CreateNotificationResponse.model_construct(
+                notification_id=row["notification_id"],
+                created_at=row["created_at"],
+                status="created",
+                reason=None
+            )
 
         except Exception as e:
             raise handle_db_exception(e)
@@ -430,10 +587,11 @@ class NotificationService:
 
             row = result[0]
 
-            logger.info(
-                "user_settings_retrieved",
-                user_id=str(user_id)
-            )
+            if _info_enabled():
+                logger.info(
+                    "user_settings_retrieved",
+                    user_id=user_id
+                )
 
             return {
                 "user_id": user_id,
@@ -477,10 +635,11 @@ class NotificationService:
                 settings.timezone
             )
 
-            logger.info(
-                "user_settings_updated",
-                user_id=str(user_id)
-            )
+            if _info_enabled():
+                logger.info(
+                    "user_settings_updated",
+                    user_id=user_id
+                )
 
             # Return updated settings
             return await self.get_user_settings(user_id)
@@ -4,13 +4,16 @@ Calls stored procedures for notification settings.
 """
 from typing import Optional
 from uuid import UUID
+import logging
 import structlog
 
 from app.core.database import db
 from app.core.exceptions import handle_db_exception
+from app.core.logging_config import level_enabled
 from app.schemas.settings import NotificationSettingsResponse
 
 logger = structlog.get_logger()
+_info_enabled = level_enabled(__name__, logging.INFO)
 
 class SettingsService:
     """Service for notification settings operations"""
@@ -87,11 +90,12 @@ class SettingsService:
 
             row = result[0]
 
-            logger.info(
-                "settings_updated",
-                user_id=str(user_id),
-                ghost_mode=row["ghost_mode"]
-            )
+            if _info_enabled():
+                logger.info(
+                    "settings_updated",
+                    user_id=user_id,
+                    ghost_mode=row["ghost_mode"]
+                )
 
             return NotificationSettingsResponse(
                 user_id=row["user_id"],
@@ -0,0 +1,69 @@
+-- ============================================================================
+-- NOTIFICATIONS API - BULK UNREAD COUNT
+-- ============================================================================
+-- Multi-user variant of sp_get_unread_count used by the unread-count batcher
+-- (app/core/batcher.py). One call answers many concurrent badge requests.
+-- Apply to database: docker exec -i activity-postgres-db psql -U postgres -d activitydb < migrations/02_unread_count_bulk.sql
+-- ============================================================================
+
+-- ============================================================================
+-- 10. sp_get_unread_count_bulk - Unread counts for many (user, premium) pairs
+-- ============================================================================
+-- p_user_ids and p_include_premium_only are parallel arrays. One row is
+-- returned per distinct (user_id, include_premium_only) pair, including
+-- users with zero unread notifications.
+CREATE OR REPLACE FUNCTION activity.sp_get_unread_count_bulk(
+    p_user_ids UUID[],
+    p_include_premium_only BOOLEAN[]
+)
+RETURNS TABLE (
+    user_id UUID,
+    include_premium_only BOOLEAN,
+    total_unread BIGINT,
+    activity_invite_count BIGINT,
+    activity_reminder_count BIGINT,
+    activity_update_count BIGINT,
+    community_invite_count BIGINT,
+    new_member_count BIGINT,
+    new_post_count BIGINT,
+    comment_count BIGINT,
+    reaction_count BIGINT,
+    mention_count BIGINT,
+    profile_view_count BIGINT,
+    new_favorite_count BIGINT,
+    system_count BIGINT
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        r.req_user_id,
+        r.req_include_premium_only,
+        COUNT(n.notification_id)::BIGINT,
+        COUNT(n.notification_id) FILTER (WHERE n.notification_type = 'activity_invite')::BIGINT,
+        COUNT(n.notification_id) FILTER (WHERE n.notification_type = 'activity_reminder')::BIGINT,
+        COUNT(n.notification_id) FILTER (WHERE n.notification_type = 'activity_update')::BIGINT,
+        COUNT(n.notification_id) FILTER (WHERE n.notification_type = 'community_invite')::BIGINT,
+        COUNT(n.notification_id) FILTER (WHERE n.notification_type = 'new_member')::BIGINT,
+        COUNT(n.notification_id) FILTER (WHERE n.notification_type = 'new_post')::BIGINT,
+        COUNT(n.notification_id) FILTER (WHERE n.notification_type = 'comment')::BIGINT,
+        COUNT(n.notification_id) FILTER (WHERE n.notification_type = 'reaction')::BIGINT,
+        COUNT(n.notification_id) FILTER (WHERE n.notification_type = 'mention')::BIGINT,
+        COUNT(n.notification_id) FILTER (WHERE n.notification_type = 'profile_view')::BIGINT,
+        COUNT(n.notification_id) FILTER (WHERE n.notification_type = 'new_favorite')::BIGINT,
+        COUNT(n.notification_id) FILTER (WHERE n.notification_type = 'system')::BIGINT
+    FROM (
+        SELECT DISTINCT u.req_user_id, u.req_include_premium_only
+        FROM unnest(p_user_ids, p_include_premium_only) AS u(req_user_id, req_include_premium_only)
+    ) r
+    LEFT JOIN activity.notifications n
+        ON n.user_id = r.req_user_id
+        AND n.status = 'unread'::activity.notification_status
+        AND (
+            r.req_include_premium_only = TRUE
+            OR n.notification_type::VARCHAR NOT IN ('profile_view', 'new_favorite')
+        )
+    GROUP BY r.req_user_id, r.req_include_premium_only;
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION activity.sp_get_unread_count_bulk TO postgres;
@@ -0,0 +1,114 @@
+-- ============================================================================
+-- NOTIFICATIONS API - KEYSET PAGINATION
+-- ============================================================================
+-- Cursor-based variant of sp_get_user_notifications. Pages are addressed by
+-- the (created_at, notification_id) of the last row seen instead of an
+-- OFFSET, so page N costs the same as page 1. No total_count window/CTE.
+-- Apply to database: docker exec -i activity-postgres-db psql -U postgres -d activitydb < migrations/03_notifications_keyset.sql
+-- ============================================================================
+
+-- Supports ORDER BY created_at DESC, notification_id DESC per user
+CREATE INDEX IF NOT EXISTS idx_notifications_user_created_id
+    ON activity.notifications(user_id, created_at DESC, notification_id DESC);
+
+-- ============================================================================
+-- 11. sp_get_user_notifications_keyset - Cursor-paginated notifications for user
+-- ============================================================================
+-- Pass NULL cursor values for the first page. Column order matches
+-- sp_get_notification_by_id (the API maps both by position).
+CREATE OR REPLACE FUNCTION activity.sp_get_user_notifications_keyset(
+    p_user_id UUID,
+    p_status VARCHAR DEFAULT NULL,
+    p_notification_type VARCHAR DEFAULT NULL,
+    p_limit INT DEFAULT 20,
+    p_cursor_created_at TIMESTAMP WITH TIME ZONE DEFAULT NULL,
+    p_cursor_notification_id UUID DEFAULT NULL,
+    p_include_premium_only BOOLEAN DEFAULT FALSE
+)
+RETURNS TABLE (
+    notification_id UUID,
+    user_id UUID,
+    actor_user_id UUID,
+    actor_username VARCHAR,
+    actor_first_name VARCHAR,
+    actor_last_name VARCHAR,
+    actor_main_photo_url VARCHAR,
+    notification_type VARCHAR,
+    target_type VARCHAR,
+    target_id UUID,
+    title VARCHAR,
+    message TEXT,
+    status VARCHAR,
+    created_at TIMESTAMP WITH TIME ZONE,
+    read_at TIMESTAMP WITH TIME ZONE,
+    payload JSONB
+) AS $$
+BEGIN
+    -- Separate statements (not "cursor IS NULL OR ...") so the seek stays an
+    -- index condition even once plpgsql switches to a generic cached plan
+    IF p_cursor_created_at IS NULL THEN
+        RETURN QUERY
+        SELECT
+            n.notification_id,
+            n.user_id,
+            n.actor_user_id,
+            u.username,
+            u.first_name,
+            u.last_name,
+            u.main_photo_url,
+            n.notification_type::VARCHAR,
+            n.target_type,
+            n.target_id,
+            n.title,
+            n.message,
+            n.status::VARCHAR,
+            n.created_at,
+            n.read_at,
+            n.payload
+        FROM activity.notifications n
+        LEFT JOIN activity.users u ON n.actor_user_id = u.user_id
+        WHERE n.user_id = p_user_id
+            AND (p_status IS NULL OR n.status::VARCHAR = p_status)
+            AND (p_notification_type IS NULL OR n.notification_type::VARCHAR = p_notification_type)
+            AND (
+                p_include_premium_only = TRUE
+                OR n.notification_type::VARCHAR NOT IN ('profile_view', 'new_favorite')
+            )
+        ORDER BY n.created_at DESC, n.notification_id DESC
+        LIMIT p_limit;
+    ELSE
+        RETURN QUERY
+        SELECT
+            n.notification_id,
+            n.user_id,
+            n.actor_user_id,
+            u.username,
+            u.first_name,
+            u.last_name,
+            u.main_photo_url,
+            n.notification_type::VARCHAR,
+            n.target_type,
+            n.target_id,
+            n.title,
+            n.message,
+            n.status::VARCHAR,
+            n.created_at,
+            n.read_at,
+            n.payload
+        FROM activity.notifications n
+        LEFT JOIN activity.users u ON n.actor_user_id = u.user_id
+        WHERE n.user_id = p_user_id
+            AND (n.created_at, n.notification_id) < (p_cursor_created_at, p_cursor_notification_id)
+            AND (p_status IS NULL OR n.status::VARCHAR = p_status)
+            AND (p_notification_type IS NULL OR n.notification_type::VARCHAR = p_notification_type)
+            AND (
+                p_include_premium_only = TRUE
+                OR n.notification_type::VARCHAR NOT IN ('profile_view', 'new_favorite')
+            )
+        ORDER BY n.created_at DESC, n.notification_id DESC
+        LIMIT p_limit;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION activity.sp_get_user_notifications_keyset TO postgres;
@@ -0,0 +1,111 @@
+-- ============================================================================
+-- NOTIFICATIONS API - DENORMALIZED NOTIFICATION COUNTERS
+-- ============================================================================
+-- Per (user_id, notification_type, status) row counts maintained by triggers,
+-- so totals are a handful of index lookups instead of a COUNT over every
+-- matching notification.
+-- Apply to database: docker exec -i activity-postgres-db psql -U postgres -d activitydb < migrations/04_notification_counters.sql
+-- ============================================================================
+
+BEGIN;
+
+-- No FK to users: rows are adjusted while a user's notifications cascade-delete
+CREATE TABLE IF NOT EXISTS activity.notification_counters (
+    user_id UUID NOT NULL,
+    notification_type activity.notification_type NOT NULL,
+    status activity.notification_status NOT NULL,
+    cnt BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, notification_type, status)
+);
+
+-- Block writers while backfilling so no change slips between backfill and trigger
+LOCK TABLE activity.notifications IN SHARE ROW EXCLUSIVE MODE;
+
+INSERT INTO activity.notification_counters (user_id, notification_type, status, cnt)
+SELECT user_id, notification_type, status, COUNT(*)
+FROM activity.notifications
+GROUP BY user_id, notification_type, status
+ON CONFLICT (user_id, notification_type, status)
+DO UPDATE SET cnt = EXCLUDED.cnt;
+
+-- ============================================================================
+-- fn_bump_notification_counter - Add delta to one counter row (upsert)
+-- ============================================================================
+CREATE OR REPLACE FUNCTION activity.fn_bump_notification_counter(
+    p_user_id UUID,
+    p_notification_type activity.notification_type,
+    p_status activity.notification_status,
+    p_delta BIGINT
+)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO activity.notification_counters AS c (user_id, notification_type, status, cnt)
+    VALUES (p_user_id, p_notification_type, p_status, p_delta)
+    ON CONFLICT (user_id, notification_type, status)
+    DO UPDATE SET cnt = c.cnt + EXCLUDED.cnt;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Only the trigger below may adjust counters
+REVOKE EXECUTE ON FUNCTION activity.fn_bump_notification_counter FROM PUBLIC;
+
+-- ============================================================================
+-- trg_notification_counters - Keep counters in step with activity.notifications
+-- ============================================================================
+-- SECURITY DEFINER: runs as the owner, so roles that write notifications
+-- through the SPs (api_user) need no privileges on notification_counters.
+CREATE OR REPLACE FUNCTION activity.trg_notification_counters()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = pg_catalog, pg_temp
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM activity.fn_bump_notification_counter(OLD.user_id, OLD.notification_type, OLD.status, -1);
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM activity.fn_bump_notification_counter(NEW.user_id, NEW.notification_type, NEW.status, 1);
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_notification_counters ON activity.notifications;
+CREATE TRIGGER trg_notification_counters
+    AFTER INSERT OR DELETE OR UPDATE OF user_id, notification_type, status
+    ON activity.notifications
+    FOR EACH ROW
+    EXECUTE FUNCTION activity.trg_notification_counters();
+
+COMMIT;
+
+-- ============================================================================
+-- 12. sp_get_notification_totals - Matching notification count from counters
+-- ============================================================================
+-- Same filter semantics as sp_get_user_notifications_keyset.
+CREATE OR REPLACE FUNCTION activity.sp_get_notification_totals(
+    p_user_id UUID,
+    p_status VARCHAR DEFAULT NULL,
+    p_notification_type VARCHAR DEFAULT NULL,
+    p_include_premium_only BOOLEAN DEFAULT FALSE
+)
+RETURNS TABLE (
+    total_count BIGINT
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT COALESCE(SUM(c.cnt), 0)::BIGINT
+    FROM activity.notification_counters c
+    WHERE c.user_id = p_user_id
+        AND (p_status IS NULL OR c.status::VARCHAR = p_status)
+        AND (p_notification_type IS NULL OR c.notification_type::VARCHAR = p_notification_type)
+        AND (
+            p_include_premium_only = TRUE
+            OR c.notification_type::VARCHAR NOT IN ('profile_view', 'new_favorite')
+        );
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION activity.sp_get_notification_totals TO postgres;
@@ -0,0 +1,160 @@
+-- ============================================================================
+-- NOTIFICATIONS API - UNREAD COUNTS FROM DENORMALIZED COUNTERS
+-- ============================================================================
+-- Rewrites sp_get_unread_count / sp_get_unread_count_bulk to read the
+-- trigger-maintained activity.notification_counters (migration 04) instead of
+-- aggregating the user's unread notifications on every call.
+-- Requires: 04_notification_counters.sql
+-- Apply to database: docker exec -i activity-postgres-db psql -U postgres -d activitydb < migrations/05_unread_count_from_counters.sql
+-- ============================================================================
+
+-- ============================================================================
+-- 6. sp_get_unread_count - Get unread notification counts by type
+-- ============================================================================
+CREATE OR REPLACE FUNCTION activity.sp_get_unread_count(
+    p_user_id UUID,
+    p_include_premium_only BOOLEAN DEFAULT FALSE
+)
+RETURNS TABLE (
+    total_unread BIGINT,
+    activity_invite_count BIGINT,
+    activity_reminder_count BIGINT,
+    activity_update_count BIGINT,
+    community_invite_count BIGINT,
+    new_member_count BIGINT,
+    new_post_count BIGINT,
+    comment_count BIGINT,
+    reaction_count BIGINT,
+    mention_count BIGINT,
+    profile_view_count BIGINT,
+    new_favorite_count BIGINT,
+    system_count BIGINT
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        COALESCE(SUM(c.cnt), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'activity_invite'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'activity_reminder'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'activity_update'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'community_invite'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'new_member'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'new_post'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'comment'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'reaction'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'mention'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'profile_view'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'new_favorite'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'system'), 0)::BIGINT
+    FROM activity.notification_counters c
+    WHERE c.user_id = p_user_id
+        AND c.status = 'unread'::activity.notification_status
+        AND (
+            p_include_premium_only = TRUE
+            OR c.notification_type::VARCHAR NOT IN ('profile_view', 'new_favorite')
+        );
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- 10. sp_get_unread_count_bulk - Unread counts for many (user, premium) pairs
+-- ============================================================================
+CREATE OR REPLACE FUNCTION activity.sp_get_unread_count_bulk(
+    p_user_ids UUID[],
+    p_include_premium_only BOOLEAN[]
+)
+RETURNS TABLE (
+    user_id UUID,
+    include_premium_only BOOLEAN,
+    total_unread BIGINT,
+    activity_invite_count BIGINT,
+    activity_reminder_count BIGINT,
+    activity_update_count BIGINT,
+    community_invite_count BIGINT,
+    new_member_count BIGINT,
+    new_post_count BIGINT,
+    comment_count BIGINT,
+    reaction_count BIGINT,
+    mention_count BIGINT,
+    profile_view_count BIGINT,
+    new_favorite_count BIGINT,
+    system_count BIGINT
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        r.req_user_id,
+        r.req_include_premium_only,
+        COALESCE(SUM(c.cnt), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'activity_invite'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'activity_reminder'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'activity_update'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'community_invite'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'new_member'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'new_post'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'comment'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'reaction'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'mention'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'profile_view'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'new_favorite'), 0)::BIGINT,
+        COALESCE(SUM(c.cnt) FILTER (WHERE c.notification_type = 'system'), 0)::BIGINT
+    FROM (
+        SELECT DISTINCT u.req_user_id, u.req_include_premium_only
+        FROM unnest(p_user_ids, p_include_premium_only) AS u(req_user_id, req_include_premium_only)
+    ) r
+    LEFT JOIN activity.notification_counters c
+        ON c.user_id = r.req_user_id
+        AND c.status = 'unread'::activity.notification_status
+        AND (
+            r.req_include_premium_only = TRUE
+            OR c.notification_type::VARCHAR NOT IN ('profile_view', 'new_favorite')
+        )
+    GROUP BY r.req_user_id, r.req_include_premium_only;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- 13. sp_reconcile_notification_counters - Safety-net rebuild of counters
+-- ============================================================================
+-- Run nightly (cron / pg_cron):
+--   SELECT * FROM activity.sp_reconcile_notification_counters();
+-- Returns the number of counter rows that had drifted and were corrected.
+CREATE OR REPLACE FUNCTION activity.sp_reconcile_notification_counters()
+RETURNS TABLE (
+    fixed_rows BIGINT
+) AS $$
+DECLARE
+    v_removed BIGINT;
+    v_fixed BIGINT;
+BEGIN
+    -- Hold off writers so counts and triggers cannot interleave
+    LOCK TABLE activity.notifications IN SHARE ROW EXCLUSIVE MODE;
+
+    -- Counter rows whose notifications no longer exist
+    DELETE FROM activity.notification_counters c
+    WHERE c.cnt <> 0
+        AND NOT EXISTS (
+            SELECT 1 FROM activity.notifications n
+            WHERE n.user_id = c.user_id
+                AND n.notification_type = c.notification_type
+                AND n.status = c.status
+        );
+    GET DIAGNOSTICS v_removed = ROW_COUNT;
+
+    -- Missing or drifted counter rows
+    INSERT INTO activity.notification_counters AS c (user_id, notification_type, status, cnt)
+    SELECT n.user_id, n.notification_type, n.status, COUNT(*)
+    FROM activity.notifications n
+    GROUP BY n.user_id, n.notification_type, n.status
+    ON CONFLICT (user_id, notification_type, status)
+    DO UPDATE SET cnt = EXCLUDED.cnt
+    WHERE c.cnt <> EXCLUDED.cnt;
+    GET DIAGNOSTICS v_fixed = ROW_COUNT;
+
+    RETURN QUERY SELECT v_removed + v_fixed;
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION activity.sp_get_unread_count TO postgres;
+GRANT EXECUTE ON FUNCTION activity.sp_get_unread_count_bulk TO postgres;
+GRANT EXECUTE ON FUNCTION activity.sp_reconcile_notification_counters TO postgres;
@@ -0,0 +1,59 @@
+-- ============================================================================
+-- NOTIFICATIONS API - BULK MARK-READ RETURNS UPDATED IDS
+-- ============================================================================
+-- sp_mark_notifications_as_read_bulk now returns the ids it changed next to
+-- the count, so callers can evict per-notification caches without a second
+-- query. The return type changes, so the function is dropped and recreated;
+-- DROP discards existing grants, so the app role's EXECUTE is restored below.
+-- Apply to database: docker exec -i activity-postgres-db psql -U postgres -d activitydb < migrations/06_mark_read_bulk_returning.sql
+-- ============================================================================
+
+-- ============================================================================
+-- 4. sp_mark_notifications_as_read_bulk - Bulk mark as read
+-- ============================================================================
+-- Precedence is unchanged: explicit ids, else all of one type, else all unread.
+DROP FUNCTION IF EXISTS activity.sp_mark_notifications_as_read_bulk(UUID, UUID[], VARCHAR);
+
+CREATE FUNCTION activity.sp_mark_notifications_as_read_bulk(
+    p_user_id UUID,
+    p_notification_ids UUID[] DEFAULT NULL,
+    p_notification_type VARCHAR DEFAULT NULL
+)
+RETURNS TABLE (
+    updated_count BIGINT,
+    updated_ids UUID[]
+) AS $$
+BEGIN
+    RETURN QUERY
+    WITH upd AS (
+        UPDATE activity.notifications n
+        SET
+            status = 'read'::activity.notification_status,
+            read_at = NOW()
+        WHERE n.user_id = p_user_id
+            AND n.status = 'unread'::activity.notification_status
+            AND (p_notification_ids IS NULL OR n.notification_id = ANY(p_notification_ids))
+            AND (
+                p_notification_ids IS NOT NULL
+                OR p_notification_type IS NULL
+                OR n.notification_type::VARCHAR = p_notification_type
+            )
+        RETURNING n.notification_id
+    )
+    SELECT
+        COUNT(*)::BIGINT,
+        COALESCE(array_agg(upd.notification_id), ARRAY[]::UUID[])
+    FROM upd;
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION activity.sp_mark_notifications_as_read_bulk TO postgres;
+
+-- Application role from PRODUCTION.md, when present
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'api_user') THEN
+        GRANT EXECUTE ON FUNCTION activity.sp_mark_notifications_as_read_bulk TO api_user;
+    END IF;
+END;
+$$;
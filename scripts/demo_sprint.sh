@@ -288,10 +288,10 @@ query_database "SELECT notification_id, user_id, notification_type::TEXT, title,
 print_section "PHASE 3: Testing User Endpoints (Alice - Premium)"
 
 print_test "GET /api/v1/notifications - List Alice's notifications"
-response=$(test_endpoint "GET" "/api/v1/notifications?limit=10" "$ALICE_TOKEN" "" "200")
+response=$(test_endpoint "GET" "/api/v1/notifications?limit=10&include_total=true" "$ALICE_TOKEN" "" "200")
 notif_count=$(echo "$response" | jq -r '.pagination.total // 0')
 print_data "Found $notif_count notifications"
-echo "$response" | jq '.data[] | {id: .notification_id, type: .notification_type, title: .title, status: .status}'
+echo "$response" | jq '.notifications[] | {id: .notification_id, type: .notification_type, title: .title, status: .status}'
 
 print_test "GET /api/v1/notifications/{id} - Get single notification"
 if [ -n "$notif_1_id" ]; then
@@ -349,7 +349,7 @@ fi
 print_section "PHASE 4: Premium Features Validation"
 
 print_test "Alice (Premium) - Should see profile_view notifications"
-response=$(test_endpoint "GET" "/api/v1/notifications?type=profile_view" "$ALICE_TOKEN" "" "200")
+response=$(test_endpoint "GET" "/api/v1/notifications?type=profile_view&include_total=true" "$ALICE_TOKEN" "" "200")
 premium_count=$(echo "$response" | jq -r '.pagination.total // 0')
 if [ "$premium_count" -gt 0 ]; then
     print_success "Premium user can see profile_view notifications (count: $premium_count)"
@@ -370,7 +370,7 @@ fi
 print_test "Bob (Free) - List notifications (should exclude premium types)"
 response=$(test_endpoint "GET" "/api/v1/notifications" "$BOB_TOKEN" "" "200")
 print_data "Bob's notifications (Free user):"
-echo "$response" | jq '.data[] | {type: .notification_type, title: .title}'
+echo "$response" | jq '.notifications[] | {type: .notification_type, title: .title}'
 
 # Phase 5: Error Handling Tests
 print_section "PHASE 5: Error Handling & Validation"
@@ -387,13 +387,13 @@ else
     print_error "Expected 401 for invalid JWT, got $http_code"
 fi
 
-print_test "Missing Authorization header - Should return 403"
+print_test "Missing Authorization header - Should return 401"
 response=$(curl -s -w "\n%{http_code}" -X GET "$API_URL/api/v1/notifications" 2>&1)
 http_code=$(echo "$response" | tail -n1)
-if [ "$http_code" = "403" ]; then
-    print_success "Correctly rejected missing auth header (403)"
+if [ "$http_code" = "401" ]; then
+    print_success "Correctly rejected missing auth header (401)"
 else
-    print_error "Expected 403 for missing auth, got $http_code"
+    print_error "Expected 401 for missing auth, got $http_code"
 fi
 
 print_test "Non-existent notification ID - Should return 404 or empty"
@@ -5,11 +5,14 @@ Generates 1000 realistic notification records with proper distribution
 
 Usage:
     python seed_notifications.py
+    SEED=42 python seed_notifications.py  # reproducible data
 
 Requirements:
     pip install psycopg2-binary python-dotenv
+    pip install orjson  # optional, faster payload serialization
 """
 
+import itertools
 import os
 import random
 import sys
@@ -17,9 +20,21 @@ from datetime import datetime, timedelta
 from typing import Optional
 from dotenv import load_dotenv
 
+try:
+    import orjson
+
+    def dumps_json(value) -> str:
+        # psycopg2 would send bytes as bytea, which cannot be cast to jsonb
+        return orjson.dumps(value).decode()
+except ImportError:
+    import json
+
+    def dumps_json(value) -> str:
+        return json.dumps(value, default=str)
+
 try:
     import psycopg2
-    from psycopg2.extras import execute_batch
+    from psycopg2.extras import execute_batch, execute_values
 except ImportError:
     print("❌ Error: psycopg2 not installed")
     print("   Run: pip install psycopg2-binary")
@@ -29,6 +44,9 @@ except ImportError:
 # Load environment variables
 load_dotenv()
 
+# Single generator for the whole run; set SEED for reproducible data
+rng = random.Random(os.getenv('SEED'))
+
 
 # Notification type distribution (type, weight, has_actor)
 NOTIFICATION_TYPES = [
@@ -53,6 +71,11 @@ STATUS_DISTRIBUTION = [
     ('archived', 0.05),
 ]
 
+# Cumulative weights, computed once, for batched weighted picks
+TYPES_CUM = list(itertools.accumulate(t[1] for t in NOTIFICATION_TYPES))
+STATUS_POP = [s for s, _ in STATUS_DISTRIBUTION]
+STATUS_CUM = list(itertools.accumulate(w for _, w in STATUS_DISTRIBUTION))
+
 
 def get_db_connection():
     """Create database connection from environment variables"""
@@ -103,98 +126,87 @@ def get_test_user_ids(conn):
         return [row[0] for row in cur.fetchall()]
 
 
-def random_date_last_90_days():
-    """Generate random date in last 90 days, weighted towards recent"""
+def random_date_last_90_days(now: datetime) -> datetime:
+    """Generate random date in the 90 days before `now`, weighted towards recent"""
     # Using exponential distribution to favor recent dates
-    days_ago = random.random() ** 2 * 90
-    return datetime.now() - timedelta(days=days_ago)
-
-
-def generate_payload(notification_type: str) -> dict:
+    days_ago = rng.random() ** 2 * 90
+    return now - timedelta(days=days_ago)
+
+
+# Payload choice pools, built once instead of on every generate_payload call
+_COMMENT_TEXTS = (
+    'Great photo! Where was this taken?',
+    'Thanks for organizing!',
+    'Count me in for next time!',
+    'Amazing experience!',
+)
+_COMMENT_POST_TITLES = ('Amazing sunset hike', 'Weekend cycling adventure', 'Coffee meetup recap')
+_REACTION_TYPES = ('like', 'love', 'celebrate', 'support')
+_INVITE_ACTIVITY_TITLES = ('Coffee & Networking', 'Sunday Brunch', 'Beach Volleyball', 'Movie Night')
+_INVITE_LOCATIONS = ('Central Park', 'Coffee House', 'Beach Club')
+_NEW_POST_COMMUNITIES = ('Runners Club', 'Food Lovers', 'Yoga Enthusiasts')
+_REMINDER_ACTIVITY_TITLES = ('Sunday Brunch Meetup', 'Morning Run', 'Yoga Session')
+_UPDATE_TYPES = ('location_changed', 'time_changed', 'details_updated')
+_VIEWER_INTERESTS = ('hiking', 'photography', 'cooking', 'yoga', 'running')
+_INVITE_COMMUNITIES = ('Food Lovers', 'Tech Enthusiasts', 'Book Club')
+_NEW_MEMBER_COMMUNITIES = ('Yoga Enthusiasts', 'Runners Club')
+_SYSTEM_CODES = ('ACCOUNT_VERIFIED', 'SUBSCRIPTION_RENEWED', 'SECURITY_ALERT', 'FEATURE_ANNOUNCEMENT')
+
+# Only the builder for the requested type runs, so unused branches cost nothing
+_PAYLOAD_BUILDERS = {
+    'comment': lambda now: {
+        'comment_text': rng.choice(_COMMENT_TEXTS),
+        'post_title': rng.choice(_COMMENT_POST_TITLES),
+    },
+    'reaction': lambda now: {
+        'reaction_type': rng.choice(_REACTION_TYPES),
+        'post_title': 'Weekend cycling adventure',
+    },
+    'activity_invite': lambda now: {
+        'activity_title': rng.choice(_INVITE_ACTIVITY_TITLES),
+        'activity_date': (now + timedelta(days=rng.randint(1, 30))).isoformat(),
+        'location': rng.choice(_INVITE_LOCATIONS),
+    },
+    'new_post': lambda now: {
+        'community_name': rng.choice(_NEW_POST_COMMUNITIES),
+        'post_title': 'Check out this new post!',
+    },
+    'activity_reminder': lambda now: {
+        'activity_title': rng.choice(_REMINDER_ACTIVITY_TITLES),
+        'starts_at': (now + timedelta(hours=24)).isoformat(),
+    },
+    'activity_update': lambda now: {
+        'activity_title': 'Beach Volleyball',
+        'update_type': rng.choice(_UPDATE_TYPES),
+    },
+    'mention': lambda now: {
+        'post_title': 'Great meetup yesterday!',
+        'mention_context': 'Thanks @user for organizing!',
+    },
+    'profile_view': lambda now: {
+        'is_premium_feature': True,
+        'viewer_interests': rng.sample(_VIEWER_INTERESTS, 2),
+    },
+    'new_favorite': lambda now: {
+        'is_premium_feature': True,
+    },
+    'community_invite': lambda now: {
+        'community_name': rng.choice(_INVITE_COMMUNITIES),
+        'inviter_username': f'user_{rng.randint(1, 100)}',
+    },
+    'new_member': lambda now: {
+        'community_name': rng.choice(_NEW_MEMBER_COMMUNITIES),
+    },
+    'system': lambda now: {
+        'notification_code': rng.choice(_SYSTEM_CODES),
+    },
+}
+
+
+def generate_payload(notification_type: str, now: datetime) -> dict:
     """Generate realistic payload for notification type"""
-    payloads = {
-        'comment': {
-            'comment_text': random.choice([
-                'Great photo! Where was this taken?',
-                'Thanks for organizing!',
-                'Count me in for next time!',
-                'Amazing experience!',
-            ]),
-            'post_title': random.choice([
-                'Amazing sunset hike',
-                'Weekend cycling adventure',
-                'Coffee meetup recap',
-            ]),
-        },
-        'reaction': {
-            'reaction_type': random.choice(['like', 'love', 'celebrate', 'support']),
-            'post_title': 'Weekend cycling adventure',
-        },
-        'activity_invite': {
-            'activity_title': random.choice([
-                'Coffee & Networking',
-                'Sunday Brunch',
-                'Beach Volleyball',
-                'Movie Night',
-            ]),
-            'activity_date': (datetime.now() + timedelta(days=random.randint(1, 30))).isoformat(),
-            'location': random.choice(['Central Park', 'Coffee House', 'Beach Club']),
-        },
-        'new_post': {
-            'community_name': random.choice(['Runners Club', 'Food Lovers', 'Yoga Enthusiasts']),
-            'post_title': 'Check out this new post!',
-        },
-        'activity_reminder': {
-            'activity_title': random.choice(['Sunday Brunch Meetup', 'Morning Run', 'Yoga Session']),
-            'starts_at': (datetime.now() + timedelta(hours=24)).isoformat(),
-        },
-        'activity_update': {
-            'activity_title': 'Beach Volleyball',
-            'update_type': random.choice(['location_changed', 'time_changed', 'details_updated']),
-        },
-        'mention': {
-            'post_title': 'Great meetup yesterday!',
-            'mention_context': 'Thanks @user for organizing!',
-        },
-        'profile_view': {
-            'is_premium_feature': True,
-            'viewer_interests': random.sample(['hiking', 'photography', 'cooking', 'yoga', 'running'], 2),
-        },
-        'new_favorite': {
-            'is_premium_feature': True,
-        },
-        'community_invite': {
-            'community_name': random.choice(['Food Lovers', 'Tech Enthusiasts', 'Book Club']),
-            'inviter_username': f'user_{random.randint(1, 100)}',
-        },
-        'new_member': {
-            'community_name': random.choice(['Yoga Enthusiasts', 'Runners Club']),
-        },
-        'system': {
-            'notification_code': random.choice([
-                'ACCOUNT_VERIFIED',
-                'SUBSCRIPTION_RENEWED',
-                'SECURITY_ALERT',
-                'FEATURE_ANNOUNCEMENT',
-            ]),
-        },
-    }
-
-    return payloads.get(notification_type, {})
-
-
-def pick_weighted_choice(choices):
-    """Pick a choice based on weights"""
-    total_weight = sum(weight for _, weight in choices)
-    random_value = random.random() * total_weight
-
-    cumulative = 0
-    for choice, weight in choices:
-        cumulative += weight
-        if random_value <= cumulative:
-            return choice
-
-    return choices[-1][0]  # fallback
+    builder = _PAYLOAD_BUILDERS.get(notification_type)
+    return builder(now) if builder else {}
 
 
 def generate_notifications(conn, count: int = 1000):
@@ -206,47 +218,39 @@ def generate_notifications(conn, count: int = 1000):
         raise Exception("Need at least 2 test users. Run create_test_users first.")
 
     notifications = []
+    now = datetime.now()  # one reference time for the whole run
 
-    for i in range(count):
-        # Pick random recipient
-        recipient_id = random.choice(user_ids)
-
-        # Pick notification type
-        type_random = random.random()
-        cumulative = 0
-        selected_type = None
+    # Draw every per-row categorical choice in one call each, then assemble rows
+    n_users = len(user_ids)
+    recipient_idxs = rng.choices(range(n_users), k=count)
+    selected_types = rng.choices(NOTIFICATION_TYPES, cum_weights=TYPES_CUM, k=count)
+    statuses = rng.choices(STATUS_POP, cum_weights=STATUS_CUM, k=count)
 
-        for notif_type, weight, has_actor, target_type, title, message in NOTIFICATION_TYPES:
-            cumulative += weight
-            if type_random <= cumulative:
-                selected_type = (notif_type, has_actor, target_type, title, message)
-                break
-
-        if selected_type is None:
-            selected_type = NOTIFICATION_TYPES[-1][:5]
-
-        notif_type, has_actor, target_type, title, message = selected_type
+    for i, (recipient_idx, selected_type, status) in enumerate(zip(recipient_idxs, selected_types, statuses)):
+        recipient_id = user_ids[recipient_idx]
+        notif_type, _, has_actor, target_type, title, message = selected_type
 
         # Pick actor (if applicable)
         actor_id = None
-        if has_actor and random.random() < 0.8:  # 80% chance
-            actor_id = random.choice([uid for uid in user_ids if uid != recipient_id])
+        if has_actor and rng.random() < 0.8:  # 80% chance
+            # Uniform over everyone but the recipient: draw from n-1 slots, skip past recipient
+            actor_idx = rng.randrange(n_users - 1)
+            if actor_idx >= recipient_idx:
+                actor_idx += 1
+            actor_id = user_ids[actor_idx]
 
         # Generate timestamp
-        created_at = random_date_last_90_days()
-
-        # Pick status
-        status = pick_weighted_choice([(s, w) for s, w in STATUS_DISTRIBUTION])
+        created_at = random_date_last_90_days(now)
 
         # Set read_at if read or archived
         read_at = None
         if status in ('read', 'archived'):
             read_at = created_at + timedelta(
-                hours=random.randint(1, 168)  # 1 hour to 7 days
+                hours=rng.randint(1, 168)  # 1 hour to 7 days
             )
 
         # Generate payload
-        payload = generate_payload(notif_type)
+        payload = generate_payload(notif_type, now)
 
         notifications.append((
             recipient_id,
@@ -264,9 +268,9 @@ def generate_notifications(conn, count: int = 1000):
         if (i + 1) % 100 == 0:
             print(f"   📊 Generated {i + 1} notifications...")
 
-    # Bulk insert
+    # Bulk insert: one multi-row INSERT per page instead of one statement per row
     with conn.cursor() as cur:
-        execute_batch(cur, """
+        execute_values(cur, """
             INSERT INTO activity.notifications (
                 user_id,
                 actor_user_id,
@@ -279,7 +283,12 @@ def generate_notifications(conn, count: int = 1000):
                 created_at,
                 read_at,
                 payload
-            ) VALUES (
+            ) VALUES %s
+        """, [(
+            n[0], n[1], n[2], n[3], n[4], n[5], n[6], n[7], n[8],
+            dumps_json(n[9])
+        ) for n in notifications],
+            template="""(
                 %s,
                 %s,
                 %s::activity.notification_type,
@@ -291,11 +300,9 @@ def generate_notifications(conn, count: int = 1000):
                 %s,
                 %s,
                 %s::jsonb
-            )
-        """, [(
-            n[0], n[1], n[2], n[3], n[4], n[5], n[6], n[7], n[8],
-            str(n[9]).replace("'", '"')  # Convert dict to JSON string
-        ) for n in notifications])
+            )""",
+            page_size=500
+        )
 
         conn.commit()
 
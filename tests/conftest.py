@@ -0,0 +1,16 @@
+"""
+Shared test setup.
+app.config builds Settings() at import time, so required settings get test
+defaults here, before any test module imports the app.
+"""
+import os
+
+for _name, _value in {
+    "DB_HOST": "localhost",
+    "DB_NAME": "test",
+    "DB_USER": "test",
+    "DB_PASSWORD": "test",
+    "JWT_SECRET": "test-jwt-secret-at-least-32-characters",
+    "SERVICE_TOKEN": "test-service-token",
+}.items():
+    os.environ.setdefault(_name, _value)
@@ -0,0 +1,115 @@
+"""
+Tests for app.core.batcher.Batcher request coalescing.
+"""
+import asyncio
+
+import pytest
+
+from app.core.batcher import Batcher
+
+def run(coro):
+    return asyncio.run(coro)
+
+def test_concurrent_submits_share_one_handler_call():
+    calls = []
+
+    async def handler(requests):
+        calls.append(requests)
+        return [a + b for a, b in requests]
+
+    async def main():
+        batcher = Batcher("test", handler, max_batch=64, max_wait_ms=20)
+        results = await asyncio.gather(*(batcher.submit(i, 10) for i in range(5)))
+        await batcher.close()
+        return results
+
+    assert run(main()) == [10, 11, 12, 13, 14]
+    assert calls == [[(i, 10) for i in range(5)]]
+
+def test_max_batch_splits_dispatches():
+    calls = []
+
+    async def handler(requests):
+        calls.append(len(requests))
+        return [args[0] for args in requests]
+
+    async def main():
+        batcher = Batcher("test", handler, max_batch=2, max_wait_ms=20)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        await batcher.close()
+        return results
+
+    assert run(main()) == [0, 1, 2, 3, 4]
+    assert calls == [2, 2, 1]
+
+def test_single_submit_is_dispatched_alone():
+    calls = []
+
+    async def handler(requests):
+        calls.append(requests)
+        return ["only"]
+
+    async def main():
+        batcher = Batcher("test", handler, max_wait_ms=1)
+        result = await batcher.submit("x")
+        await batcher.close()
+        return result
+
+    assert run(main()) == "only"
+    assert calls == [[("x",)]]
+
+def test_handler_error_reaches_every_caller():
+    async def handler(requests):
+        raise RuntimeError("boom")
+
+    async def main():
+        batcher = Batcher("test", handler, max_wait_ms=5)
+        results = await asyncio.gather(
+            batcher.submit(1), batcher.submit(2), return_exceptions=True
+        )
+        await batcher.close()
+        return results
+
+    results = run(main())
+    assert len(results) == 2
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+def test_close_while_collecting_cancels_waiting_callers():
+    async def handler(requests):
+        raise AssertionError("batch must not be dispatched after close")
+
+    async def main():
+        batcher = Batcher("test", handler, max_wait_ms=10_000)
+        caller = asyncio.create_task(batcher.submit(1))
+        # Let the worker take the item off the queue and start collecting
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert batcher._queue.empty()
+
+        await batcher.close()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(caller, timeout=1)
+
+    run(main())
+
+def test_close_waits_for_inflight_batch():
+    release = None
+
+    async def handler(requests):
+        await release.wait()
+        return ["done"]
+
+    async def main():
+        nonlocal release
+        release = asyncio.Event()
+        batcher = Batcher("test", handler, max_wait_ms=1)
+        caller = asyncio.create_task(batcher.submit(1))
+        await asyncio.sleep(0.01)
+
+        closing = asyncio.create_task(batcher.close())
+        await asyncio.sleep(0)
+        release.set()
+        await closing
+        return await asyncio.wait_for(caller, timeout=1)
+
+    assert run(main()) == "done"
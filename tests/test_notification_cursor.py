@@ -0,0 +1,89 @@
+"""
+Tests for the keyset pagination cursor in app.services.notification_service.
+"""
+import asyncio
+import base64
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.core.exceptions import ValidationException
+from app.services.notification_service import (
+    NotificationService,
+    _decode_cursor,
+    _encode_cursor,
+)
+
+def run(coro):
+    return asyncio.run(coro)
+
+def b64(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+VALID_CURSOR = _encode_cursor(
+    datetime(2025, 2, 10, 14, 30, 0, 123456, tzinfo=timezone.utc),
+    UUID("550e8400-e29b-41d4-a716-446655440000")
+)
+
+def seek_page(rows, cursor, limit):
+    """Mirror sp_get_user_notifications_keyset: newest first, (created_at, id) < cursor"""
+    ordered = sorted(rows, reverse=True)
+    if cursor is not None:
+        after = _decode_cursor(cursor)
+        ordered = [row for row in ordered if row < after]
+    page = ordered[:limit + 1]
+    next_cursor = _encode_cursor(*page[limit - 1]) if len(page) > limit else None
+    return page[:limit], next_cursor
+
+def test_round_trip_keeps_microseconds_and_timezone():
+    created_at = datetime(2025, 2, 10, 14, 30, 0, 123456, tzinfo=timezone.utc)
+    notification_id = uuid4()
+
+    assert _decode_cursor(_encode_cursor(created_at, notification_id)) == (created_at, notification_id)
+
+def test_pages_across_timestamp_tie_without_skips_or_duplicates():
+    tie = datetime(2025, 2, 10, 14, 30, 0, 500000, tzinfo=timezone.utc)
+    rows = [(tie, uuid4()) for _ in range(5)]
+    rows += [(tie + timedelta(microseconds=1), uuid4()), (tie - timedelta(microseconds=1), uuid4())]
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = seek_page(rows, cursor, limit=2)
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert seen == sorted(rows, reverse=True)
+
+@pytest.mark.parametrize("cursor", [
+    "!!!!",
+    "not base64 at all",
+    VALID_CURSOR[:-3],
+    VALID_CURSOR[:10],
+    base64.urlsafe_b64encode(b"\xff\xfe\xfd").decode(),
+    b64("garbage"),
+    b64("2025-02-10T14:30:00+00:00"),
+    b64("2025-02-10T14:30:00+00:00|not-a-uuid"),
+    b64("2025-13-40T14:30:00+00:00|550e8400-e29b-41d4-a716-446655440000"),
+    b64("2025-02-10T14:30:00+00:00;550e8400-e29b-41d4-a716-446655440000"),
+])
+def test_malformed_or_tampered_cursor_is_422(cursor):
+    with pytest.raises(ValidationException) as exc_info:
+        _decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 422
+
+def test_service_rejects_bad_cursor_before_querying():
+    # db.pool is not connected in tests: reaching the database would raise a 500 instead
+    with pytest.raises(ValidationException) as exc_info:
+        run(NotificationService().get_user_notifications(
+            user_id=uuid4(),
+            status=None,
+            notification_type=None,
+            limit=20,
+            cursor=VALID_CURSOR[:-3],
+            include_premium_only=False
+        ))
+
+    assert exc_info.value.status_code == 422
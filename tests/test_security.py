@@ -0,0 +1,84 @@
+"""
+Tests for JWT validation and the decoded-token cache in app.core.security.
+"""
+import asyncio
+import hashlib
+import time
+import uuid
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from app.config import settings
+from app.core import security
+
+def run(coro):
+    return asyncio.run(coro)
+
+def make_token(**claims) -> str:
+    return jwt.encode(claims, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+
+def cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    security._token_cache.clear()
+    yield
+    security._token_cache.clear()
+
+def test_valid_token_is_cached():
+    token = make_token(sub=str(uuid.uuid4()), exp=int(time.time()) + 60)
+
+    payload = security.verify_jwt_token(token)
+
+    assert security._token_cache[cache_key(token)] == (payload, payload["exp"])
+    assert security.verify_jwt_token(token) is payload
+
+def test_expired_cached_token_is_rejected_and_evicted():
+    exp = int(time.time()) - 5
+    token = make_token(sub=str(uuid.uuid4()), exp=exp)
+    # Simulate an entry cached while the token was still valid
+    security._token_cache[cache_key(token)] = ({"sub": "cached"}, exp)
+
+    with pytest.raises(HTTPException) as exc_info:
+        security.verify_jwt_token(token)
+
+    assert exc_info.value.status_code == 401
+    assert cache_key(token) not in security._token_cache
+
+def test_invalid_signature_is_rejected_and_not_cached():
+    token = jwt.encode({"sub": str(uuid.uuid4())}, "another-secret-at-least-32-characters", algorithm="HS256")
+
+    with pytest.raises(HTTPException) as exc_info:
+        security.verify_jwt_token(token)
+
+    assert exc_info.value.status_code == 401
+    assert cache_key(token) not in security._token_cache
+
+def test_current_user_has_uuid_user_id():
+    user_id = uuid.uuid4()
+    token = make_token(sub=str(user_id), subscription_level="premium")
+
+    user = run(security.get_current_user(authorization=f"Bearer {token}"))
+
+    assert user.user_id == user_id
+    assert user.subscription_level == "premium"
+
+@pytest.mark.parametrize("sub", ["not-a-uuid", "1234", 12345, ["x"], "", None])
+def test_bad_sub_returns_401(sub):
+    claims = {} if sub is None else {"sub": sub}
+    token = make_token(**claims)
+
+    with pytest.raises(HTTPException) as exc_info:
+        run(security.get_current_user(authorization=f"Bearer {token}"))
+
+    assert exc_info.value.status_code == 401
+
+@pytest.mark.parametrize("authorization", [None, "", "Basic abc", "Bearer", "Bearer   "])
+def test_missing_or_non_bearer_header_returns_401(authorization):
+    with pytest.raises(HTTPException) as exc_info:
+        run(security.get_current_user(authorization=authorization))
+
+    assert exc_info.value.status_code == 401